@@ -1,13 +1,18 @@
 from __future__ import print_function
 
 import sys
+import threading
 from os import environ
 from base64 import b64encode
-import json
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from itertools import chain
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from requests.packages.urllib3.exceptions import MaxRetryError, ResponseError
+from requests.packages.urllib3.util.retry import Retry
 from urlobject import URLObject
 import six
 from six.moves.urllib.parse import urlencode
@@ -40,39 +45,101 @@ from nylas.client.scheduler_restful_model_collection import (
     SchedulerRestfulModelCollection,
 )
 from nylas.client.authentication_models import Authentication
-from nylas.utils import timestamp_from_dt, create_request_body, AuthMethod, HttpMethod
+from nylas.utils import (
+    timestamp_from_dt,
+    create_request_body,
+    json_dumps,
+    json_loads,
+    AuthMethod,
+    HttpMethod,
+)
 
 DEBUG = environ.get("NYLAS_CLIENT_DEBUG")
 API_SERVER = "https://api.nylas.com"
 SUPPORTED_API_VERSION = "2.5"
+# Number of resource bodies kept around to revalidate with their ETag
+ETAG_CACHE_SIZE = 256
+# Longest Retry-After, in seconds, waited out before retrying a request
+MAX_RETRY_AFTER = 5
+
+# Error statuses that raise something more specific than NylasApiError
+_STATUS_CODE_TO_EXC = {
+    # HTTP status code 402 normally means "Payment Required",
+    # but when Nylas uses that status code, it means something different.
+    # Usually it indicates an upstream error on the provider.
+    # We let Requests handle most HTTP errors, but for this one,
+    # we will handle it separate and handle a _different_ exception
+    # so that users don't think they need to pay.
+    402: MessageRejectedError,
+    429: RateLimitError,
+}
 
 
 def _validate(response):
     if DEBUG:  # pragma: no cover
+        # Request bodies are sent pre-encoded, print them as text
+        body = response.request.body
+        if six.PY3 and isinstance(body, bytes):
+            body = body.decode("utf-8", "replace")
         print(
             "{method} {url} ({body}) => {status}: {text}".format(
                 method=response.request.method,
                 url=response.request.url,
-                body=response.request.body,
+                body=body,
                 status=response.status_code,
                 text=response.text,
             )
         )
 
-    if response.status_code == 402:
-        # HTTP status code 402 normally means "Payment Required",
-        # but when Nylas uses that status code, it means something different.
-        # Usually it indicates an upstream error on the provider.
-        # We let Requests handle most HTTP errors, but for this one,
-        # we will handle it separate and handle a _different_ exception
-        # so that users don't think they need to pay.
-        raise MessageRejectedError(response)
-    elif response.status_code == 429:
-        raise RateLimitError(response)
-    elif response.status_code >= 400:
-        raise NylasApiError(response)
+    status_code = response.status_code
+    if status_code < 400:
+        return response
+    raise _STATUS_CODE_TO_EXC.get(status_code, NylasApiError)(response)
+
+
+class _BearerAuth(AuthBase):
+    """Sets a prebuilt bearer token Authorization header on requests"""
+
+    def __init__(self, token):
+        self.header = "Bearer {token}".format(token=token)
 
-    return response
+    def __call__(self, request):
+        request.headers["Authorization"] = self.header
+        return request
+
+
+class _Retry(Retry):
+    """Gives up instead of retrying when the server asks for a long wait"""
+
+    def increment(self, method=None, url=None, response=None, *args, **kwargs):
+        if response is not None:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                # With raise_on_status disabled urllib3 returns the response
+                raise MaxRetryError(
+                    kwargs.get("_pool"),
+                    url,
+                    ResponseError("Retry-After of %s seconds" % retry_after),
+                )
+        return super(_Retry, self).increment(method, url, response, *args, **kwargs)
+
+
+def _http_session():
+    session = requests.Session()
+    # Keep more connections alive for applications sharing a client across
+    # threads, and retry idempotent requests that hit a transient gateway
+    # error. The last response is still returned (and raised by _validate)
+    # once the retries are exhausted, or straight away when the server asks
+    # to wait longer than MAX_RETRY_AFTER.
+    retries = _Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
 
 
 def _validate_availability_query(query):
@@ -82,9 +149,35 @@ def _validate_availability_query(query):
         raise ValueError("Must set either 'emails' or 'calendars' in the query.")
 
 
-class APIClient(json.JSONEncoder):
+class APIClient(object):
     """API client for the Nylas API."""
 
+    __slots__ = (
+        "api_server",
+        "api_version",
+        "authorize_url",
+        "access_token_url",
+        "revoke_url",
+        "application_url",
+        "revoke_all_url",
+        "ip_addresses_url",
+        "token_info_url",
+        "client_secret",
+        "client_id",
+        "session",
+        "admin_session",
+        "version",
+        "auth_token",
+        "_access_token",
+        "_bearer_auth",
+        "_url_prefix_cache",
+        "_etag_cache",
+        "_etag_lock",
+        "_basic_auth_cache",
+        "_collections",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         client_id=environ.get("NYLAS_CLIENT_ID"),
@@ -111,7 +204,13 @@ class APIClient(json.JSONEncoder):
         self.client_secret = client_secret
         self.client_id = client_id
 
-        self.session = requests.Session()
+        self._url_prefix_cache = {}
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
+        self._basic_auth_cache = {}
+        self._collections = {}
+
+        self.session = _http_session()
         self.version = __VERSION__
         major, minor, revision, _, __ = sys.version_info
         version_header = "Nylas Python SDK {} - {}.{}.{}".format(
@@ -129,7 +228,7 @@ class APIClient(json.JSONEncoder):
 
         # Requests to the /a/ namespace don't use an auth token but
         # the client_secret. Set up a specific session for this.
-        self.admin_session = requests.Session()
+        self.admin_session = _http_session()
 
         if client_secret is not None:
             self.admin_session.headers = {
@@ -139,7 +238,6 @@ class APIClient(json.JSONEncoder):
                 "User-Agent": version_header,
             }
             self.admin_session.headers.update(self._add_auth_header(AuthMethod.BASIC))
-        super(APIClient, self).__init__()
 
     @property
     def access_token(self):
@@ -148,6 +246,10 @@ class APIClient(json.JSONEncoder):
     @access_token.setter
     def access_token(self, value):
         self._access_token = value
+        # Cached responses belong to the previous token's account
+        with self._etag_lock:
+            self._etag_cache.clear()
+        self._bearer_auth = _BearerAuth(value) if value else None
 
     def authentication_url(
         self,
@@ -212,7 +314,7 @@ class APIClient(json.JSONEncoder):
             headers=headers,
             data=urlencode(args),
         )
-        results = _validate(resp).json()
+        results = json_loads(_validate(resp).content)
 
         self.access_token = results["access_token"]
         return results
@@ -239,8 +341,7 @@ class APIClient(json.JSONEncoder):
     def application_details(self):
         application_details_url = self.application_url.format(client_id=self.client_id)
         resp = self.admin_session.get(application_details_url)
-        _validate(resp).json()
-        return resp.json()
+        return json_loads(_validate(resp).content)
 
     def update_application_details(
         self, application_name=None, icon_url=None, redirect_uris=None
@@ -254,12 +355,8 @@ class APIClient(json.JSONEncoder):
         if redirect_uris is not None:
             data["redirect_uris"] = redirect_uris
 
-        headers = {"Content-Type": "application/json"}
-        headers.update(self.admin_session.headers)
-        resp = self.admin_session.put(
-            application_details_url, json=data, headers=headers
-        )
-        return _validate(resp).json()
+        resp = self.admin_session.put(application_details_url, json=data)
+        return json_loads(_validate(resp).content)
 
     def revoke_token(self):
         resp = requests.post(self.revoke_url, auth=(self.access_token, None))
@@ -275,10 +372,8 @@ class APIClient(json.JSONEncoder):
         if keep_access_token is not None:
             data["keep_access_token"] = keep_access_token
 
-        headers = {"Content-Type": "application/json"}
-        headers.update(self.admin_session.headers)
-        resp = self.admin_session.post(revoke_all_url, json=data, headers=headers)
-        _validate(resp).json()
+        resp = self.admin_session.post(revoke_all_url, json=data)
+        _validate(resp)
         if keep_access_token != self.access_token:
             self.auth_token = None
             self.access_token = None
@@ -286,8 +381,7 @@ class APIClient(json.JSONEncoder):
     def ip_addresses(self):
         ip_addresses_url = self.ip_addresses_url.format(client_id=self.client_id)
         resp = self.admin_session.get(ip_addresses_url)
-        _validate(resp).json()
-        return resp.json()
+        return json_loads(_validate(resp).content)
 
     def token_info(self, account_id=None):
         token_info_url = ""
@@ -299,13 +393,10 @@ class APIClient(json.JSONEncoder):
             token_info_url = self.token_info_url.format(
                 client_id=self.client_id, account_id=self.account.id
             )
-        headers = {"Content-Type": "application/json"}
-        headers.update(self.admin_session.headers)
         resp = self.admin_session.post(
-            token_info_url, headers=headers, json={"access_token": self.access_token}
+            token_info_url, json={"access_token": self.access_token}
         )
-        _validate(resp).json()
-        return resp.json()
+        return json_loads(_validate(resp).content)
 
     def free_busy(self, emails, start_at, end_at, calendars=None):
         if isinstance(emails, six.string_types):
@@ -318,7 +409,7 @@ class APIClient(json.JSONEncoder):
             end_time = timestamp_from_dt(end_at)
         else:
             end_time = end_at
-        url = "{api_server}/calendars/free-busy".format(api_server=self.api_server)
+        url = self.api_server + "/calendars/free-busy"
         data = {
             "emails": emails,
             "start_time": start_time,
@@ -329,8 +420,7 @@ class APIClient(json.JSONEncoder):
 
         _validate_availability_query(data)
         resp = self._request(HttpMethod.POST, url, json=data, cls=Calendar)
-        _validate(resp)
-        return resp.json()
+        return json_loads(_validate(resp).content)
 
     def open_hours(self, emails, days, timezone, start, end):
         if isinstance(emails, six.string_types):
@@ -385,7 +475,7 @@ class APIClient(json.JSONEncoder):
         if open_hours is not None:
             self._validate_open_hours(emails, open_hours, free_busy)
 
-        url = "{api_server}/calendars/availability".format(api_server=self.api_server)
+        url = self.api_server + "/calendars/availability"
         data = {
             "emails": emails,
             "duration_minutes": duration_minutes,
@@ -406,8 +496,7 @@ class APIClient(json.JSONEncoder):
 
         _validate_availability_query(data)
         resp = self._request(HttpMethod.POST, url, json=data, cls=Calendar)
-        _validate(resp)
-        return resp.json()
+        return json_loads(_validate(resp).content)
 
     def consecutive_availability(
         self,
@@ -444,9 +533,7 @@ class APIClient(json.JSONEncoder):
         if open_hours is not None:
             self._validate_open_hours(emails, open_hours, free_busy)
 
-        url = "{api_server}/calendars/availability/consecutive".format(
-            api_server=self.api_server
-        )
+        url = self.api_server + "/calendars/availability/consecutive"
         data = {
             "emails": emails,
             "duration_minutes": duration_minutes,
@@ -463,62 +550,61 @@ class APIClient(json.JSONEncoder):
 
         _validate_availability_query(data)
         resp = self._request(HttpMethod.POST, url, json=data, cls=Calendar)
-        _validate(resp)
-        return resp.json()
+        return json_loads(_validate(resp).content)
 
     @property
     def account(self):
-        return self._get_resource(SingletonAccount, "")
+        return self._get_singleton_resource(SingletonAccount, "")
 
     @property
     def accounts(self):
         if self.is_opensource_api():
-            return RestfulModelCollection(APIAccount, self)
-        return RestfulModelCollection(Account, self)
+            return self._get_collection(APIAccount)
+        return self._get_collection(Account)
 
     @property
     def threads(self):
-        return RestfulModelCollection(Thread, self)
+        return self._get_collection(Thread)
 
     @property
     def folders(self):
-        return RestfulModelCollection(Folder, self)
+        return self._get_collection(Folder)
 
     @property
     def labels(self):
-        return RestfulModelCollection(Label, self)
+        return self._get_collection(Label)
 
     @property
     def messages(self):
-        return RestfulModelCollection(Message, self)
+        return self._get_collection(Message)
 
     @property
     def files(self):
-        return RestfulModelCollection(File, self)
+        return self._get_collection(File)
 
     @property
     def drafts(self):
-        return RestfulModelCollection(Draft, self)
+        return self._get_collection(Draft)
 
     @property
     def contacts(self):
-        return RestfulModelCollection(Contact, self)
+        return self._get_collection(Contact)
 
     @property
     def events(self):
-        return RestfulModelCollection(Event, self)
+        return self._get_collection(Event)
 
     @property
     def room_resources(self):
-        return RestfulModelCollection(RoomResource, self)
+        return self._get_collection(RoomResource)
 
     @property
     def calendars(self):
-        return RestfulModelCollection(Calendar, self)
+        return self._get_collection(Calendar)
 
     @property
     def job_statuses(self):
-        return RestfulModelCollection(JobStatus, self)
+        return self._get_collection(JobStatus)
 
     @property
     def scheduler(self):
@@ -526,7 +612,7 @@ class APIClient(json.JSONEncoder):
 
     @property
     def components(self):
-        return RestfulModelCollection(Component, self)
+        return self._get_collection(Component)
 
     @property
     def deltas(self):
@@ -534,7 +620,7 @@ class APIClient(json.JSONEncoder):
 
     @property
     def webhooks(self):
-        return RestfulModelCollection(Webhook, self)
+        return self._get_collection(Webhook)
 
     @property
     def neural(self):
@@ -552,6 +638,16 @@ class APIClient(json.JSONEncoder):
     #   Private functions used by Restful Model Collection   #
     ##########################################################
 
+    def _get_collection(self, cls):
+        # Collections don't hold any state of their own, so the same one
+        # is returned every time the matching property is read. Shallow
+        # copies of the client (see SchedulerRestfulModelCollection) share
+        # the cache, so make sure the collection is bound to this client.
+        collection = self._collections.get(cls)
+        if collection is None or collection.api is not self:
+            collection = self._collections[cls] = RestfulModelCollection(cls, self)
+        return collection
+
     def _get_http_session(self, api_root):
         # Is this a request for a resource under the accounts/billing/admin
         # namespace (/a)? If the latter, pass the client_secret
@@ -560,29 +656,33 @@ class APIClient(json.JSONEncoder):
             return self.admin_session
         return self.session
 
+    def _url_prefix(self, cls, path):
+        """Return the base URL of `path` under the namespace of `cls`"""
+        # The prefix only depends on these values, so it is built once
+        # and then reused for every request made against the same path
+        key = (cls.api_root, path, self.api_server, self.client_id)
+        try:
+            return self._url_prefix_cache[key]
+        except KeyError:
+            pass
+
+        url = self.api_server
+        if cls.api_root:
+            url = "%s/%s/%s" % (url, cls.api_root, self.client_id)
+        if path:
+            url = "%s/%s" % (url, path)
+        self._url_prefix_cache[key] = url
+        return url
+
     def _get_resources(self, cls, extra=None, **filters):
-        # FIXME @karim: remove this interim code when we've got rid
-        # of the old accounts API.
-        postfix = "/{}".format(extra) if extra else ""
-        path = "/{}".format(cls.collection_name) if cls.collection_name else ""
-        if not cls.api_root:
-            url = "{server}{path}{postfix}".format(
-                server=self.api_server, path=path, postfix=postfix
-            )
-        else:
-            url = "{server}/{prefix}/{client_id}{path}{postfix}".format(
-                server=self.api_server,
-                prefix=cls.api_root,
-                client_id=self.client_id,
-                path=path,
-                postfix=postfix,
-            )
+        url = self._url_prefix(cls, cls.collection_name)
+        if extra:
+            url = "%s/%s" % (url, extra)
 
         converted_data = create_request_body(filters, cls.datetime_filter_attrs)
-        url = str(URLObject(url).add_query_params(converted_data.items()))
-        response = self._request(HttpMethod.GET, url, cls=cls)
-        results = _validate(response).json()
-        return [cls.create(self, **x) for x in results if x is not None]
+        response = self._request(HttpMethod.GET, url, cls=cls, params=converted_data)
+        results = json_loads(_validate(response).content)
+        return cls.bulk_create(self, results)
 
     def _get_resource_raw(
         self,
@@ -598,39 +698,59 @@ class APIClient(json.JSONEncoder):
         """Get an individual REST resource"""
         if path is None:
             path = cls.collection_name
-        postfix = "/{}".format(extra) if extra else ""
-        path = "/{}".format(path) if path else ""
-        resource_id = "/{}".format(resource_id) if resource_id else ""
-        if not cls.api_root:
-            url = "{server}{path}{id}{postfix}".format(
-                server=self.api_server, path=path, id=resource_id, postfix=postfix
-            )
-        else:
-            url = "{server}/{prefix}/{client_id}{path}{id}{postfix}".format(
-                server=self.api_server,
-                prefix=cls.api_root,
-                client_id=self.client_id,
-                path=path,
-                id=resource_id,
-                postfix=postfix,
-            )
+        url = self._url_prefix(cls, path)
+        if resource_id:
+            url = "%s/%s" % (url, resource_id)
+        if extra:
+            url = "%s/%s" % (url, extra)
 
         converted_data = create_request_body(filters, cls.datetime_filter_attrs)
-        url = str(URLObject(url).add_query_params(converted_data.items()))
 
         response = self._request(
             HttpMethod.GET,
             url,
             cls=cls,
+            params=converted_data,
             headers=headers,
             stream=stream,
             timeout=stream_timeout,
         )
         return _validate(response)
 
+    def _get_revalidated_content(self, cls, resource_id, **filters):
+        """Get the body of a single resource, revalidating it with its ETag"""
+        # An unchanged resource is answered with a 304 and an empty body, in
+        # which case the body from the previous response is reused
+        key = (
+            self._url_prefix(cls, cls.collection_name),
+            resource_id,
+            urlencode(sorted(filters.items()), doseq=True),
+        )
+        with self._etag_lock:
+            cached = self._etag_cache.pop(key, None)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+
+        response = self._get_resource_raw(cls, resource_id, headers=headers, **filters)
+        if cached is not None and response.status_code == 304:
+            etag, content = cached
+        else:
+            etag, content = response.headers.get("ETag"), response.content
+
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, content)
+                if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return content
+
     def _get_resource(self, cls, resource_id, **filters):
-        response = self._get_resource_raw(cls, resource_id, **filters)
-        result = response.json()
+        content = self._get_revalidated_content(cls, resource_id, **filters)
+        return cls.create(self, **json_loads(content))
+
+    def _get_singleton_resource(self, cls, resource_id, **filters):
+        """Get a resource the API may return wrapped in a one-item list"""
+        content = self._get_revalidated_content(cls, resource_id, **filters)
+        result = json_loads(content)
         if isinstance(result, list):
             result = result[0]
         return cls.create(self, **result)
@@ -642,45 +762,30 @@ class APIClient(json.JSONEncoder):
         return response.content
 
     def _create_resource(self, cls, data, **kwargs):
-        name = "{prefix}{path}".format(
-            prefix="/{}/{}".format(cls.api_root, self.client_id)
-            if cls.api_root
-            else "",
-            path="/{}".format(cls.collection_name) if cls.collection_name else "",
-        )
-        url = (
-            URLObject(self.api_server)
-            .with_path("{name}".format(name=name))
-            .set_query_params(**kwargs)
-        )
+        url = self._url_prefix(cls, cls.collection_name)
 
         if cls == File:
-            response = self._request(HttpMethod.POST, url, cls=cls, files=data)
+            response = self._request(
+                HttpMethod.POST, url, cls=cls, params=kwargs, files=data
+            )
         elif cls == Send and type(data) is not dict:
             headers = {"Content-Type": "message/rfc822"}
             response = self._request(
-                HttpMethod.POST, url, cls=cls, headers=headers, data=data
+                HttpMethod.POST, url, cls=cls, headers=headers, params=kwargs, data=data
             )
         else:
             converted_data = create_request_body(data, cls.datetime_attrs)
-            headers = {"Content-Type": "application/json"}
             response = self._request(
-                HttpMethod.POST, url, cls=cls, headers=headers, json=converted_data
+                HttpMethod.POST, url, cls=cls, params=kwargs, json=converted_data
             )
 
-        result = _validate(response).json()
+        result = json_loads(_validate(response).content)
         if cls.collection_name == "send":
             return result
         return cls.create(self, **result)
 
     def _create_resources(self, cls, data):
-        name = "{prefix}{path}".format(
-            prefix="/{}/{}".format(cls.api_root, self.client_id)
-            if cls.api_root
-            else "",
-            path="/{}".format(cls.collection_name) if cls.collection_name else "",
-        )
-        url = URLObject(self.api_server).with_path("{name}".format(name=name))
+        url = self._url_prefix(cls, cls.collection_name)
 
         if cls == File:
             response = self._request(HttpMethod.POST, url, cls=cls, files=data)
@@ -688,59 +793,36 @@ class APIClient(json.JSONEncoder):
             converted_data = [
                 create_request_body(datum, cls.datetime_attrs) for datum in data
             ]
-            headers = {"Content-Type": "application/json"}
-            response = self._request(
-                HttpMethod.POST, url, cls=cls, headers=headers, json=converted_data
-            )
+            response = self._request(HttpMethod.POST, url, cls=cls, json=converted_data)
 
-        results = _validate(response).json()
-        return [cls.create(self, **x) for x in results]
+        results = json_loads(_validate(response).content)
+        return cls.bulk_create(self, results)
 
     def _delete_resource(self, cls, resource_id, data=None, **kwargs):
-        name = "{prefix}{path}".format(
-            prefix="/{}/{}".format(cls.api_root, self.client_id)
-            if cls.api_root
-            else "",
-            path="/{}".format(cls.collection_name) if cls.collection_name else "",
-        )
-        url = (
-            URLObject(self.api_server)
-            .with_path("{name}/{id}".format(name=name, id=resource_id))
-            .set_query_params(**kwargs)
-        )
+        url = "%s/%s" % (self._url_prefix(cls, cls.collection_name), resource_id)
         if data:
-            _validate(self._request(HttpMethod.DELETE, url, cls=cls, json=data))
+            response = self._request(
+                HttpMethod.DELETE, url, cls=cls, params=kwargs, json=data
+            )
         else:
-            _validate(self._request(HttpMethod.DELETE, url, cls=cls))
+            response = self._request(HttpMethod.DELETE, url, cls=cls, params=kwargs)
+        _validate(response)
 
     def _request_update_resource(
         self, method, cls, resource_id, data, extra=None, path=None, **kwargs
     ):
         if path is None:
             path = cls.collection_name
-        name = "{prefix}{path}".format(
-            prefix="/{}/{}".format(cls.api_root, self.client_id)
-            if cls.api_root
-            else "",
-            path="/{}".format(path) if path else "",
-        )
-
-        postfix = "/{}".format(extra) if extra else ""
-        url = (
-            URLObject(self.api_server)
-            .with_path(
-                "{name}/{id}{postfix}".format(
-                    name=name, id=resource_id, postfix=postfix
-                )
-            )
-            .set_query_params(**kwargs)
-        )
+        url = "%s/%s" % (self._url_prefix(cls, path), resource_id)
+        if extra:
+            url = "%s/%s" % (url, extra)
         converted_data = create_request_body(data, cls.datetime_attrs)
 
-        response = self._request(method, url, cls=cls, json=converted_data)
+        response = self._request(
+            method, url, cls=cls, params=kwargs, json=converted_data
+        )
 
-        result = _validate(response)
-        return result.json()
+        return json_loads(_validate(response).content)
 
     def _patch_resource(self, cls, resource_id, data, extra=None, path=None, **kwargs):
         return self._request_update_resource(
@@ -759,28 +841,16 @@ class APIClient(json.JSONEncoder):
     def _post_resource(self, cls, resource_id, method_name, data, path=None):
         if path is None:
             path = cls.collection_name
-        path = "/{}".format(path) if path else ""
-        resource_id = "/{}".format(resource_id) if resource_id else ""
-        method = "/{}".format(method_name) if method_name else ""
-        if not cls.api_root:
-            url_path = "{name}{id}{method}".format(
-                name=path, id=resource_id, method=method
-            )
-        else:
-            # Management method.
-            url_path = "/{prefix}/{client_id}{path}{id}{method}".format(
-                prefix=cls.api_root,
-                client_id=self.client_id,
-                path=path,
-                id=resource_id,
-                method=method,
-            )
+        url = self._url_prefix(cls, path)
+        if resource_id:
+            url = "%s/%s" % (url, resource_id)
+        if method_name:
+            url = "%s/%s" % (url, method_name)
 
-        url = URLObject(self.api_server).with_path(url_path)
         converted_data = create_request_body(data, cls.datetime_attrs)
 
         response = self._request(HttpMethod.POST, url, cls=cls, json=converted_data)
-        return _validate(response).json()
+        return json_loads(_validate(response).content)
 
     def _call_resource_method(self, cls, resource_id, method_name, data):
         """POST a dictionary to an API method,
@@ -794,12 +864,12 @@ class APIClient(json.JSONEncoder):
             path = cls.collection_name
         if method is None:
             method = HttpMethod.PUT
-        url = URLObject(self.api_server).with_path("/neural/{name}".format(name=path))
+        url = "%s/neural/%s" % (self.api_server, path)
 
         converted_data = create_request_body(data, cls.datetime_attrs)
         response = self._request(method, url, cls=cls, json=converted_data)
 
-        result = _validate(response).json()
+        result = json_loads(_validate(response).content)
         if isinstance(result, list):
             object_list = []
             for obj in result:
@@ -833,34 +903,46 @@ class APIClient(json.JSONEncoder):
             auth_method = cls.auth_method
 
         session = self._get_http_session(api_root)
-        headers = headers or {}
-        headers.update(session.headers)
-        headers.update(self._add_auth_header(auth_method))
+        # requests merges in the session headers when preparing the request
+        headers = dict(headers) if headers else {}
+        if auth_method == AuthMethod.BEARER:
+            # The header is built once by the access_token setter
+            kwargs["auth"] = self._bearer_auth
+        else:
+            headers.update(self._add_auth_header(auth_method))
+        # Encode JSON payloads ourselves so the faster encoder is used and
+        # the already-encoded bytes are handed straight to requests
+        json_body = kwargs.pop("json", None)
+        if json_body is not None:
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["data"] = json_dumps(json_body)
         return session.request(method.name, url, headers=headers, **kwargs)
 
     def _add_auth_header(self, auth_method):
         authorization = None
         if auth_method == AuthMethod.BEARER:
-            authorization = (
-                "Bearer {token}".format(token=self.access_token)
-                if self.access_token
-                else None
-            )
+            if self._bearer_auth:
+                authorization = self._bearer_auth.header
         elif auth_method == AuthMethod.BASIC_CLIENT_ID_AND_SECRET:
             if self.client_id and self.client_secret:
-                credential = "{client_id}:{client_secret}".format(
-                    client_id=self.client_id, client_secret=self.client_secret
-                )
-                authorization = "Basic {credential}".format(
-                    credential=b64encode(credential.encode("utf8")).decode("utf8")
+                authorization = self._basic_authorization(
+                    self.client_id, self.client_secret
                 )
         else:
             if self.client_secret:
-                b64_client_secret = b64encode(
-                    ("{}:".format(self.client_secret)).encode("utf8")
-                )
-                authorization = "Basic {secret}".format(
-                    secret=b64_client_secret.decode("utf8")
-                )
+                authorization = self._basic_authorization(self.client_secret, "")
 
         return {"Authorization": authorization} if authorization else {}
+
+    def _basic_authorization(self, username, password):
+        # Encoded once per set of credentials, they rarely change
+        key = (username, password)
+        try:
+            return self._basic_auth_cache[key]
+        except KeyError:
+            pass
+
+        credential = b64encode(username.encode("utf8") + b":" + password.encode("utf8"))
+        authorization = "Basic " + credential.decode("ascii")
+        self._basic_auth_cache[key] = authorization
+        return authorization
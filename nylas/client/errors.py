@@ -1,6 +1,5 @@
-import json
-
 from requests import HTTPError
+from nylas.utils import json_loads
 
 
 class NylasError(Exception):
@@ -32,7 +31,7 @@ class NylasApiError(HTTPError):
 
     def __init__(self, response):
         try:
-            response_json = json.loads(response.text)
+            response_json = json_loads(response.content)
             error_message = "%s %s. Reason: %s. Nylas Error Type: %s" % (
                 response.status_code,
                 response.reason,
@@ -40,7 +39,8 @@ class NylasApiError(HTTPError):
                 response_json["type"],
             )
             super(NylasApiError, self).__init__(error_message, response=response)
-        except (ValueError, KeyError):
+        except (ValueError, KeyError, TypeError):
+            # Not a JSON object with the expected fields, use the raw body
             super(NylasApiError, self).__init__(response.text, response=response)
 
 
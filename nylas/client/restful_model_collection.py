@@ -1,7 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from nylas.utils import convert_metadata_pairs_to_array
 
 CHUNK_SIZE = 50
+# Maximum number of pages requested at the same time once a full page shows
+# that there are more objects to fetch
+MAX_CONCURRENT_PAGES = 8
 
 
 class RestfulModelCollection(object):
@@ -161,11 +165,41 @@ class RestfulModelCollection(object):
     def _get_model(self, id):
         return self.api._get_resource(self.model_class, id, **self.filters)
 
+    def _get_model_collection_pages(self, offset, limit):
+        end = offset + limit
+        page_offsets = range(offset, end, CHUNK_SIZE)
+        with ThreadPoolExecutor(max_workers=len(page_offsets)) as executor:
+            pages = executor.map(
+                lambda page_offset: self._get_model_collection(
+                    page_offset, min(CHUNK_SIZE, end - page_offset)
+                ),
+                page_offsets,
+            )
+            results = []
+            for page_offset, page in zip(page_offsets, pages):
+                results.extend(page)
+                # A short page is the end of the data, the pages after it
+                # would leave a gap or repeat objects if the data changed
+                if len(page) < min(CHUNK_SIZE, end - page_offset):
+                    break
+            return results
+
     def _range(self, offset=0, limit=CHUNK_SIZE):
         accumulated = []
+        concurrent = limit != float("infinity") and not self.filters.get("limit")
         while len(accumulated) < limit:
-            to_fetch = min(limit - len(accumulated), CHUNK_SIZE)
-            results = self._get_model_collection(offset + len(accumulated), to_fetch)
+            to_fetch = min(limit - len(accumulated), CHUNK_SIZE * MAX_CONCURRENT_PAGES)
+            if concurrent and accumulated and to_fetch > CHUNK_SIZE:
+                # The first page came back full, so there is more data and the
+                # rest of the requested pages can be fetched at once
+                results = self._get_model_collection_pages(
+                    offset + len(accumulated), to_fetch
+                )
+            else:
+                to_fetch = min(to_fetch, CHUNK_SIZE)
+                results = self._get_model_collection(
+                    offset + len(accumulated), to_fetch
+                )
             accumulated.extend(results)
 
             # done if we run out of data to fetch
@@ -56,6 +56,23 @@ class RestfulModel(dict):
 
     @classmethod
     def create(cls, api, **kwargs):
+        return cls._create_from_dict(api, kwargs)
+
+    @classmethod
+    def bulk_create(cls, api, items):
+        """
+        Create a list of objects from a list of API responses, skipping any
+        None entries. This is the same as calling create() on each item but
+        avoids unpacking every item into keyword arguments.
+        """
+        if cls.create.__func__ is not RestfulModel.create.__func__:
+            # Subclasses that customize create() need to go through it
+            return [cls.create(api, **item) for item in items if item is not None]
+        create = cls._create_from_dict
+        return [create(api, item) for item in items if item is not None]
+
+    @classmethod
+    def _create_from_dict(cls, api, kwargs):
         object_type = kwargs.get("object")
         cls_object_type = getattr(cls, "object_type", cls.__name__.lower())
         # These are classes that should bypass the check below because they
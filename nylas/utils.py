@@ -1,6 +1,35 @@
 from __future__ import division
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import partial
+
+import six
+
+# Prefer the faster JSON libraries when they are installed. orjson works
+# natively with bytes, so the fallbacks are wrapped to match: json_dumps
+# always returns UTF-8 encoded bytes that can be sent as a request body.
+try:
+    import orjson
+
+    # Serialize non-string dict keys as strings, the same as the stdlib does
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    json_loads = orjson.loads
+    json_dumps = partial(orjson.dumps, option=_ORJSON_OPTIONS)
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
+
+    def json_loads(data):
+        # The stdlib json only accepts bytes from Python 3.6 on
+        if six.PY3 and isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return _json.loads(data)
+
+    def json_dumps(obj):
+        return _json.dumps(obj).encode("utf-8")
 
 
 def timestamp_from_dt(dt, epoch=datetime(1970, 1, 1)):
@@ -12,10 +12,11 @@ with open("nylas/_client_sdk_version.py", "r") as fd:
     ).group(1)
 
 RUN_DEPENDENCIES = [
-    "requests[security]>=2.4.2",
+    "requests[security]>=2.12.0",
     "six>=1.4.1",
     "urlobject",
     "enum34>=1.1.10; python_version<='3.4'",
+    "futures>=3.0.0; python_version<'3'",
     "websocket-client==0.59.0",
 ]
 
@@ -1,22 +1,23 @@
 from datetime import datetime
 import pytest
+from nylas.client import APIClient
 from nylas.client.restful_models import Account, APIAccount, SingletonAccount
 
 
 def test_create_account(api_client, monkeypatch):
-    monkeypatch.setattr(api_client, "is_opensource_api", lambda: False)
+    monkeypatch.setattr(APIClient, "is_opensource_api", lambda self: False)
     account = api_client.accounts.create()
     assert isinstance(account, Account)
 
 
 def test_create_apiaccount(api_client, monkeypatch):
-    monkeypatch.setattr(api_client, "is_opensource_api", lambda: True)
+    monkeypatch.setattr(APIClient, "is_opensource_api", lambda self: True)
     account = api_client.accounts.create()
     assert isinstance(account, APIAccount)
 
 
 def test_account_json(api_client, monkeypatch):
-    monkeypatch.setattr(api_client, "is_opensource_api", lambda: False)
+    monkeypatch.setattr(APIClient, "is_opensource_api", lambda self: False)
     account = api_client.accounts.create()
     result = account.as_json()
     assert isinstance(result, dict)
@@ -94,7 +95,7 @@ def test_account_access(api_client):
 
 @pytest.mark.usefixtures("mock_accounts")
 def test_account_metadata(api_client_with_client_id, monkeypatch):
-    monkeypatch.setattr(api_client_with_client_id, "is_opensource_api", lambda: False)
+    monkeypatch.setattr(APIClient, "is_opensource_api", lambda self: False)
     account1 = api_client_with_client_id.accounts[0]
     account1["metadata"] = {"test": "value"}
     account1.save()
@@ -103,14 +104,14 @@ def test_account_metadata(api_client_with_client_id, monkeypatch):
 
 @pytest.mark.usefixtures("mock_accounts")
 def test_application_account_delete(api_client_with_client_id, monkeypatch):
-    monkeypatch.setattr(api_client_with_client_id, "is_opensource_api", lambda: False)
+    monkeypatch.setattr(APIClient, "is_opensource_api", lambda self: False)
     account1 = api_client_with_client_id.accounts[0]
     api_client_with_client_id.accounts.delete(account1.id)
 
 
 @pytest.mark.usefixtures("mock_application_details")
 def test_application_details(api_client_with_client_id, monkeypatch):
-    monkeypatch.setattr(api_client_with_client_id, "is_opensource_api", lambda: False)
+    monkeypatch.setattr(APIClient, "is_opensource_api", lambda self: False)
     app_data = api_client_with_client_id.application_details()
     assert app_data["application_name"] == "My New App Name"
     assert app_data["icon_url"] == "http://localhost:5555/icon.png"
@@ -123,7 +124,7 @@ def test_application_details(api_client_with_client_id, monkeypatch):
 
 @pytest.mark.usefixtures("mock_application_details")
 def test_update_application_details(api_client_with_client_id, monkeypatch):
-    monkeypatch.setattr(api_client_with_client_id, "is_opensource_api", lambda: False)
+    monkeypatch.setattr(APIClient, "is_opensource_api", lambda self: False)
     updated_data = api_client_with_client_id.update_application_details(
         application_name="New Name",
         icon_url="https://myurl.com/icon.png",
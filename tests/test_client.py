@@ -1,11 +1,17 @@
 import re
+import copy
 import json
+import threading
+import time
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
 from six.moves.urllib.parse import parse_qs  # pylint: disable=relative-import
 import pytest
 from urlobject import URLObject
 import responses
 from nylas.client import APIClient
-from nylas.client.restful_models import Contact
+from nylas.client.client import API_SERVER
+from nylas.client.errors import NylasApiError
+from nylas.client.restful_models import Account, APIAccount, Contact
 from nylas.utils import AuthMethod
 
 
@@ -67,6 +73,86 @@ def test_client_admin_headers():
     assert "Nylas Python SDK" in headers["User-Agent"]
 
 
+def test_client_retries_gateway_errors():
+    client = APIClient(client_id="bounce", client_secret="foo")
+    for session in (client.session, client.admin_session):
+        retries = session.get_adapter("https://api.nylas.com").max_retries
+        assert retries.total == 3
+        assert set(retries.status_forcelist) == {502, 503, 504}
+        assert retries.raise_on_status is False
+        assert retries.respect_retry_after_header is True
+
+
+@pytest.fixture
+def gateway_server():
+    """
+    Serve queued (status, headers, body) responses over plain HTTP, since
+    `responses` replaces the adapter and never reaches urllib3's retries.
+    """
+    queue = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, headers, body = queue.pop(0)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    client = APIClient(access_token="token")
+    # Only the constructor insists on https://
+    client.api_server = "http://127.0.0.1:%d" % server.server_port
+    client.session.trust_env = False
+    client.session.mount("http://", client.session.get_adapter(API_SERVER))
+    yield client, queue
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_retries_gateway_error_then_succeeds(gateway_server):
+    client, queue = gateway_server
+    contact = json.dumps({"id": "c1", "object": "contact"}).encode("utf-8")
+    queue.append((502, {}, b"Bad Gateway"))
+    queue.append((200, {"Content-Type": "application/json"}, contact))
+
+    assert client.contacts.get("c1").id == "c1"
+    assert not queue
+
+
+def test_client_retry_waits_for_short_retry_after(gateway_server):
+    client, queue = gateway_server
+    contact = json.dumps({"id": "c1", "object": "contact"}).encode("utf-8")
+    queue.append((503, {"Retry-After": "1"}, b"Service Unavailable"))
+    queue.append((200, {"Content-Type": "application/json"}, contact))
+
+    start = time.time()
+    assert client.contacts.get("c1").id == "c1"
+    assert time.time() - start >= 1
+    assert not queue
+
+
+def test_client_retry_gives_up_on_long_retry_after(gateway_server):
+    client, queue = gateway_server
+    contact = json.dumps({"id": "c1", "object": "contact"}).encode("utf-8")
+    queue.append((503, {"Retry-After": "120"}, b"Service Unavailable"))
+    queue.append((200, {"Content-Type": "application/json"}, contact))
+
+    start = time.time()
+    with pytest.raises(NylasApiError):
+        client.contacts.get("c1")
+    assert time.time() - start < 10
+    assert len(queue) == 1
+
+
 def test_custom_api_version():
     # Can specify API server
     custom = APIClient(api_version="500")
@@ -229,6 +315,18 @@ def test_client_opensource_api(api_client):
     assert api_client.is_opensource_api() == True
 
 
+def test_client_collections_are_reused(api_client):
+    assert api_client.events is api_client.events
+    assert api_client.events is not api_client.calendars
+    assert api_client.accounts.model_class is APIAccount
+    api_client.client_id = "foo"
+    api_client.client_secret = "super-sekrit"
+    assert api_client.accounts.model_class is Account
+    client_copy = copy.copy(api_client)
+    assert client_copy.events.api is client_copy
+    assert api_client.events.api is api_client
+
+
 def test_client_revoke_token(mocked_responses, api_client, api_url):
     endpoint = re.compile(api_url + "/oauth/revoke")
     mocked_responses.add(responses.POST, endpoint, status=200, body="")
@@ -348,6 +446,32 @@ def test_count(mocked_responses, api_client, api_url):
     assert contact_count == 721
 
 
+def test_get_resource_revalidates_etag(mocked_responses, api_client, api_url):
+    contact = {"id": "9hga75n6mdvq4zgcmhcn7hpys", "object": "contact"}
+
+    def callback(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, {"ETag": '"v1"'}, ""
+        return 200, {"ETag": '"v1"'}, json.dumps(contact)
+
+    mocked_responses.add_callback(
+        responses.GET,
+        api_url + "/contacts/9hga75n6mdvq4zgcmhcn7hpys",
+        callback=callback,
+    )
+
+    first = api_client.contacts.get("9hga75n6mdvq4zgcmhcn7hpys")
+    second = api_client.contacts.get("9hga75n6mdvq4zgcmhcn7hpys")
+    assert first.id == second.id == "9hga75n6mdvq4zgcmhcn7hpys"
+    assert "If-None-Match" not in mocked_responses.calls[0].request.headers
+    assert mocked_responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert mocked_responses.calls[1].response.status_code == 304
+
+    api_client.access_token = "other-account"
+    api_client.contacts.get("9hga75n6mdvq4zgcmhcn7hpys")
+    assert "If-None-Match" not in mocked_responses.calls[2].request.headers
+
+
 def test_add_auth_header_bearer(api_client):
     api_client.access_token = "access_token"
     auth_header = api_client._add_auth_header(AuthMethod.BEARER)
@@ -200,6 +200,14 @@ def test_calendar_events(api_client):
     assert all(isinstance(event, Event) for event in calendar.events)
 
 
+def test_event_bulk_create(api_client, message_body):
+    events = Event.bulk_create(api_client, [message_body, None, message_body])
+    assert len(events) == 2
+    assert events[0] == Event.create(api_client, **message_body)
+    assert all(isinstance(event, Event) for event in events)
+    assert events[0].when == message_body["when"]
+
+
 @pytest.mark.usefixtures("mock_events", "mock_send_rsvp")
 def test_event(mocked_responses, api_client):
     event = api_client.events.first()
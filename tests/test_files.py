@@ -1,6 +1,7 @@
 import cgi
 from io import BytesIO
 import pytest
+import responses
 from nylas.client.errors import FileUploadError
 
 
@@ -62,6 +63,22 @@ def test_file_download(api_client, mocked_responses):
     assert data == "Hello, World!"
 
 
+@pytest.mark.usefixtures("mock_files")
+def test_file_download_is_not_etag_cached(api_client, mocked_responses, api_url):
+    myfile = api_client.files.first()
+    mocked_responses.replace(
+        responses.GET,
+        "{base}/files/{file_id}/download".format(base=api_url, file_id=myfile.id),
+        body=b"Hello, World!",
+        headers={"ETag": '"v1"'},
+    )
+
+    assert myfile.download() == b"Hello, World!"
+    assert myfile.download() == b"Hello, World!"
+    assert not api_client._etag_cache
+    assert "If-None-Match" not in mocked_responses.calls[-1].request.headers
+
+
 def test_file_invalid_upload(api_client):
     myfile = api_client.files.create()
     with pytest.raises(FileUploadError) as exc:
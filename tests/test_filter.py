@@ -7,12 +7,9 @@ from urlobject import URLObject
 
 
 def test_no_filter(mocked_responses, api_client, api_url, message_body):
-    message_body_list_50 = [message_body for _ in range(1, 51)]
-    message_body_list_22 = [message_body for _ in range(1, 23)]
-
     values = [
-        (200, {}, json.dumps(message_body_list_22)),
-        (200, {}, json.dumps(message_body_list_50)),
+        (200, {}, json.dumps([message_body] * 22).encode("utf-8")),
+        (200, {}, json.dumps([message_body] * 50).encode("utf-8")),
     ]
 
     def callback(_request):
@@ -44,6 +41,48 @@ def test_limit_filter(mocked_responses, api_client, api_url, message_body):
     assert query["limit"] == "51"
 
 
+@pytest.mark.usefixtures("mock_event_create_response_with_limits")
+def test_known_limit_fetches_pages_concurrently(mocked_responses, api_client):
+    events = api_client.events.all(limit=120)
+    assert len(events) == 120
+    pages = sorted(
+        (int(query["offset"]), int(query["limit"]))
+        for query in (
+            URLObject(call.request.url).query_dict for call in mocked_responses.calls
+        )
+    )
+    assert pages == [(0, 50), (50, 50), (100, 20)]
+
+
+def test_known_limit_small_collection_fetches_one_page(
+    mocked_responses, api_client, api_url, message_body
+):
+    mocked_responses.add(
+        responses.GET, api_url + "/events", body=json.dumps([message_body] * 5)
+    )
+    events = api_client.events.all(limit=400)
+    assert len(events) == 5
+    assert len(mocked_responses.calls) == 1
+
+
+def test_known_limit_stops_at_short_page(
+    mocked_responses, api_client, api_url, message_body
+):
+    sizes = {0: 50, 50: 50, 100: 10, 150: 50}
+
+    def callback(request):
+        offset = int(URLObject(request.url).query_dict["offset"])
+        body = json.dumps([message_body] * sizes.get(offset, 0))
+        return 200, {}, body
+
+    mocked_responses.add_callback(responses.GET, api_url + "/events", callback=callback)
+
+    events = api_client.events.all(limit=400)
+    # The page after the short one is left out rather than appended
+    assert len(events) == 110
+    assert len(mocked_responses.calls) == 8
+
+
 def test_no_offset(mocked_responses, api_client, api_url):
     mocked_responses.add(responses.GET, api_url + r"/events", body="[]")
     list(api_client.events.where({"in": "Nylas"}).values())
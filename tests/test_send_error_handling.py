@@ -4,7 +4,7 @@ import pytest
 import responses
 import six
 from requests import RequestException
-from nylas.client.errors import MessageRejectedError, RateLimitError
+from nylas.client.errors import MessageRejectedError, NylasApiError, RateLimitError
 
 
 def mock_sending_error(
@@ -99,3 +99,20 @@ def test_doesnt_return_server_error_if_not_defined(
     with pytest.raises(RequestException) as exc:
         draft.send()
     assert "Service Unavailable" in str(exc.value)
+
+
+@pytest.mark.usefixtures("mock_account", "mock_save_draft")
+def test_handles_error_body_that_is_not_an_object(
+    mocked_responses, api_client, api_url
+):
+    draft = api_client.drafts.create()
+    mocked_responses.add(
+        responses.POST,
+        re.compile(api_url + "/send"),
+        content_type="application/json",
+        status=400,
+        body="[]",
+    )
+    with pytest.raises(NylasApiError) as exc:
+        draft.send()
+    assert str(exc.value) == "[]"